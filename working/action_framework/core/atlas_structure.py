@@ -14,11 +14,11 @@ From atlas_polytope_comprehensive_formalization_v_1.md Appendix B:
 Total: 3 × 32 = 96 classes
 """
 
+from array import array
 from typing import List, Tuple, Set, Union
-from dataclasses import dataclass
 from fractions import Fraction
 
-from action_framework.core.exact_arithmetic import ComplexFraction
+from action_framework.core.exact_arithmetic import ComplexFraction, Rational
 
 
 # Klein quartet - the fundamental unity positions
@@ -40,7 +40,6 @@ assert len(R96_CANONICAL_BYTES) == 96, "Must have exactly 96 canonical bytes"
 assert all(b % 2 == 0 for b in R96_CANONICAL_BYTES), "All canonical bytes must be even (e₀=0)"
 
 
-@dataclass
 class ByteStructure:
     """
     Structure of a byte in terms of its 8 bits.
@@ -49,7 +48,19 @@ class ByteStructure:
         byte_value: Integer 0-255
         e0, e1, ..., e7: Individual bits
     """
-    byte_value: int
+
+    __slots__ = ('byte_value',)
+
+    def __init__(self, byte_value: int):
+        self.byte_value = byte_value
+
+    def __repr__(self) -> str:
+        return f"ByteStructure(byte_value={self.byte_value})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ByteStructure):
+            return self.byte_value == other.byte_value
+        return NotImplemented
 
     @property
     def e0(self) -> int:
@@ -92,28 +103,76 @@ class ByteStructure:
         return (self.e1, self.e2, self.e3, self.e4 - self.e5, self.e6, self.e7)
 
     def canonical_representative(self) -> int:
-        """
-        Return the canonical byte in the same resonance class.
+        """Return the canonical byte in the same resonance class."""
+        return canonical_representative(self.byte_value)
 
-        Canonical choice:
-        - e₀ = 0 (always)
-        - (e₄, e₅) chosen as: (0,1) if e₄-e₅=-1
-                               (0,0) if e₄-e₅=0
-                               (1,0) if e₄-e₅=+1
-        """
-        e1, e2, e3, diff, e6, e7 = self.resonance_class_label()
 
-        # Choose canonical (e4, e5) pair
-        if diff == -1:
-            e4, e5 = 0, 1
-        elif diff == 0:
-            e4, e5 = 0, 0
-        else:  # diff == +1
-            e4, e5 = 1, 0
+# Canonical (e₄,e₅) bits indexed by the raw 2-bit value (e₅<<1)|e₄:
+# (0,0) and (1,1) have e₄-e₅=0 → 0x00, e₄=1 → +1 → 0x10, e₅=1 → -1 → 0x20
+_CANONICAL_E45 = (0x00, 0x10, 0x20, 0x00)
+
+
+def canonical_representative(byte_value: int) -> int:
+    """
+    Return the canonical byte in the same resonance class.
+
+    Canonical choice:
+    - e₀ = 0 (always)
+    - (e₄, e₅) chosen as: (0,1) if e₄-e₅=-1
+                           (0,0) if e₄-e₅=0
+                           (1,0) if e₄-e₅=+1
+
+    Args:
+        byte_value: Any byte 0-255
+
+    Returns:
+        Canonical byte (one of R96_CANONICAL_BYTES)
+    """
+    # Keep e₁,e₂,e₃,e₆,e₇; clear e₀ and replace (e₄,e₅) with the canonical pair
+    return (byte_value & 0b11001110) | _CANONICAL_E45[(byte_value >> 4) & 3]
+
+
+# Canonical byte -> resonance class index
+CANONICAL_TO_INDEX = {byte: i for i, byte in enumerate(R96_CANONICAL_BYTES)}
+
+# Any byte 0-255 -> resonance class index, precomputed once at import.
+# Stored as bytes so it doubles as a bytes.translate() table.
+BYTE_TO_CLASS = bytes(
+    CANONICAL_TO_INDEX[canonical_representative(b)] for b in range(256)
+)
+
 
-        # Construct canonical byte with e0=0
-        canonical = (e1 << 1) | (e2 << 2) | (e3 << 3) | (e4 << 4) | (e5 << 5) | (e6 << 6) | (e7 << 7)
-        return canonical
+def canonicalize_bytes(data: Union[bytes, bytearray, memoryview, List[int]]) -> bytes:
+    """
+    Map a buffer of bytes to their resonance class indices (0-95).
+
+    The lookup runs in C via bytes.translate, so bulk projections (e.g. all
+    12,288 boundary sites) cost one pass over the buffer. Buffers must have
+    1-byte items (format 'B', 'b' or 'c'), e.g. bytes, bytearray,
+    array.array('B') or NumPy uint8 arrays; use numpy.frombuffer on the
+    result to get an array back.
+
+    Args:
+        data: Bytes-like buffer or iterable of ints in 0-255
+
+    Returns:
+        bytes of the same length, one class index per input byte
+
+    Raises:
+        TypeError: For an int, or a buffer whose items are wider than a byte
+    """
+    if isinstance(data, int):
+        # bytes(n) would silently build n zero bytes
+        raise TypeError("canonicalize_bytes expects a buffer or iterable of ints, not int")
+    try:
+        view = memoryview(data)
+    except TypeError:
+        # Not a buffer: iterable of ints, validated by bytes()
+        return bytes(data).translate(BYTE_TO_CLASS)
+    if view.itemsize != 1 or view.format not in ('B', 'b', 'c'):
+        # bytes() would reinterpret the raw memory of wider items
+        raise TypeError(f"canonicalize_bytes expects a buffer of 1-byte items, got format {view.format!r}")
+    return view.tobytes().translate(BYTE_TO_CLASS)
 
 
 class AtlasField:
@@ -131,28 +190,60 @@ class AtlasField:
         """
         Initialize Atlas field with exact arithmetic.
 
+        Real and imaginary parts are stored as two parallel lists of
+        rationals, so pointwise operations run one pass per component
+        instead of allocating a ComplexFraction per class.
+
         Args:
-            amplitudes: Either None (zeros), or list of 96 ComplexFraction
+            amplitudes: Either None (zeros), or list/tuple of 96 ComplexFraction
         """
         if amplitudes is None:
-            self.amplitudes: List[ComplexFraction] = [ComplexFraction.zero() for _ in range(96)]
-        elif isinstance(amplitudes, list):
+            self._real: List[Rational] = [Rational(0)] * 96
+            self._imag: List[Rational] = [Rational(0)] * 96
+        elif isinstance(amplitudes, (list, tuple)):
             assert len(amplitudes) == 96, f"Expected 96 amplitudes, got {len(amplitudes)}"
             assert all(isinstance(a, ComplexFraction) for a in amplitudes), "All amplitudes must be ComplexFraction"
-            self.amplitudes = amplitudes
+            self._real = [a.real for a in amplitudes]
+            self._imag = [a.imag for a in amplitudes]
         else:
             raise TypeError(f"Invalid amplitudes type: {type(amplitudes)}")
 
+    @classmethod
+    def _from_parts(cls, real: List[Rational], imag: List[Rational]) -> 'AtlasField':
+        """Wrap already-computed component lists without validation."""
+        field = cls.__new__(cls)
+        field._real = real
+        field._imag = imag
+        return field
+
+    @property
+    def amplitudes(self) -> Tuple[ComplexFraction, ...]:
+        """
+        All 96 amplitudes as ComplexFraction (built on access).
+
+        Returned as a tuple: this is a snapshot, not a view, so writes must
+        go through __setitem__ or by assigning a new list to amplitudes.
+        """
+        return tuple(ComplexFraction._make(r, i) for r, i in zip(self._real, self._imag))
+
+    @amplitudes.setter
+    def amplitudes(self, amplitudes: List[ComplexFraction]):
+        assert len(amplitudes) == 96, f"Expected 96 amplitudes, got {len(amplitudes)}"
+        assert all(isinstance(a, ComplexFraction) for a in amplitudes), "All amplitudes must be ComplexFraction"
+        self._real = [a.real for a in amplitudes]
+        self._imag = [a.imag for a in amplitudes]
+
     def __getitem__(self, class_index: int) -> ComplexFraction:
         """Get amplitude for resonance class by index 0-95."""
         assert 0 <= class_index < 96, f"Class index must be in [0,96), got {class_index}"
-        return self.amplitudes[class_index]
+        return ComplexFraction._make(self._real[class_index], self._imag[class_index])
 
     def __setitem__(self, class_index: int, value: ComplexFraction):
         """Set amplitude for resonance class by index 0-95."""
         assert 0 <= class_index < 96, f"Class index must be in [0,96), got {class_index}"
         assert isinstance(value, ComplexFraction), f"Value must be ComplexFraction, got {type(value)}"
-        self.amplitudes[class_index] = value
+        self._real[class_index] = value.real
+        self._imag[class_index] = value.imag
 
     def get_by_byte(self, byte_value: int) -> ComplexFraction:
         """
@@ -164,54 +255,66 @@ class AtlasField:
         Returns:
             Amplitude of its resonance class
         """
-        canonical = ByteStructure(byte_value).canonical_representative()
-        class_index = R96_CANONICAL_BYTES.index(canonical)
-        return self.amplitudes[class_index]
+        return self[BYTE_TO_CLASS[byte_value]]
 
     def set_by_byte(self, byte_value: int, amplitude: ComplexFraction):
         """Set amplitude for resonance class containing this byte."""
-        canonical = ByteStructure(byte_value).canonical_representative()
-        class_index = R96_CANONICAL_BYTES.index(canonical)
-        self.amplitudes[class_index] = amplitude
+        self[BYTE_TO_CLASS[byte_value]] = amplitude
 
     def __add__(self, other: 'AtlasField') -> 'AtlasField':
         """Pointwise addition (exact)."""
-        new_amplitudes = [a + b for a, b in zip(self.amplitudes, other.amplitudes)]
-        return AtlasField(new_amplitudes)
+        return AtlasField._from_parts(
+            [a + b for a, b in zip(self._real, other._real)],
+            [a + b for a, b in zip(self._imag, other._imag)]
+        )
 
     def __sub__(self, other: 'AtlasField') -> 'AtlasField':
         """Pointwise subtraction (exact)."""
-        new_amplitudes = [a - b for a, b in zip(self.amplitudes, other.amplitudes)]
-        return AtlasField(new_amplitudes)
+        return AtlasField._from_parts(
+            [a - b for a, b in zip(self._real, other._real)],
+            [a - b for a, b in zip(self._imag, other._imag)]
+        )
 
-    def __mul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'AtlasField':
+    def __mul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'AtlasField':
         """Scalar multiplication (exact)."""
         if isinstance(scalar, int):
-            scalar = ComplexFraction(scalar, 0)
-        elif isinstance(scalar, Fraction):
+            scalar = ComplexFraction.from_ints(scalar)
+        elif isinstance(scalar, (Fraction, Rational)):
             scalar = ComplexFraction(scalar, 0)
         assert isinstance(scalar, ComplexFraction), f"Scalar must be ComplexFraction, got {type(scalar)}"
-        new_amplitudes = [a * scalar for a in self.amplitudes]
-        return AtlasField(new_amplitudes)
-
-    def __rmul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'AtlasField':
+        sr, si = scalar.real, scalar.imag
+        if si == 0:
+            return AtlasField._from_parts(
+                [a * sr for a in self._real],
+                [b * sr for b in self._imag]
+            )
+        # (a + bi)(c + di) = (ac - bd) + (ad + bc)i
+        return AtlasField._from_parts(
+            [a * sr - b * si for a, b in zip(self._real, self._imag)],
+            [a * si + b * sr for a, b in zip(self._real, self._imag)]
+        )
+
+    def __rmul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'AtlasField':
         """Right scalar multiplication."""
         return self.__mul__(scalar)
 
-    def norm_squared(self) -> Fraction:
+    def norm_squared(self) -> Rational:
         """L² norm squared: ||ψ||² = Σ|ψᵢ|² (exact rational)."""
-        return sum((a.norm_squared() for a in self.amplitudes), Fraction(0))
+        return (sum((a * a for a in self._real), Rational(0))
+                + sum((b * b for b in self._imag), Rational(0)))
 
     def dot(self, other: 'AtlasField') -> ComplexFraction:
         """Inner product ⟨ψ, φ⟩ = Σ ψ̄ᵢ·φᵢ (exact)."""
-        result = ComplexFraction.zero()
-        for a, b in zip(self.amplitudes, other.amplitudes):
-            result = result + a.conjugate() * b
-        return result
+        # (a - bi)(c + di) = (ac + bd) + (ad - bc)i
+        real = sum((a * c + b * d for a, b, c, d in
+                    zip(self._real, self._imag, other._real, other._imag)), Rational(0))
+        imag = sum((a * d - b * c for a, b, c, d in
+                    zip(self._real, self._imag, other._real, other._imag)), Rational(0))
+        return ComplexFraction._make(real, imag)
 
     def copy(self) -> 'AtlasField':
         """Deep copy."""
-        return AtlasField([a for a in self.amplitudes])
+        return AtlasField._from_parts(list(self._real), list(self._imag))
 
 
 def get_klein_class_index() -> int:
@@ -230,9 +333,9 @@ def get_klein_class_index() -> int:
         Index 0 (the unity class, canonical byte 0)
     """
     # All Klein bytes canonicalize to byte 0
-    canonical = ByteStructure(0).canonical_representative()
+    canonical = canonical_representative(0)
     assert canonical == 0, "Klein unity class should be canonical byte 0"
-    idx = R96_CANONICAL_BYTES.index(canonical)
+    idx = CANONICAL_TO_INDEX[canonical]
     assert idx == 0, "Klein class should be index 0"
     return idx
 
@@ -251,41 +354,68 @@ def test_atlas_structure():
     print(f"  Klein quartet bytes {sorted(KLEIN_QUARTET)} → resonance class {klein_idx}")
     # Verify all Klein bytes map to the same class
     for byte_val in KLEIN_QUARTET:
-        canonical = ByteStructure(byte_val).canonical_representative()
+        canonical = canonical_representative(byte_val)
         assert canonical == 0, f"Klein byte {byte_val} should canonicalize to 0"
     print(f"  ✓ Klein quartet = unity class (V₄ symmetry on class 0)")
 
     # Test 3: Canonical representative computation
     test_bytes = [0, 1, 16, 17, 32, 33]  # Some test cases
     for b in test_bytes:
-        bs = ByteStructure(b)
-        canonical = bs.canonical_representative()
+        canonical = canonical_representative(b)
         assert canonical in R96_CANONICAL_BYTES, f"Canonical {canonical} for byte {b} not in R96"
+    # Exhaustive: canonical byte has e₀=0 and the same resonance class label
+    for b in range(256):
+        canonical = canonical_representative(b)
+        assert canonical & 1 == 0, f"Canonical {canonical} for byte {b} has e₀=1"
+        assert ByteStructure(canonical).resonance_class_label() == ByteStructure(b).resonance_class_label(), \
+            f"Canonical {canonical} for byte {b} is in a different class"
     print(f"  ✓ Canonical representative computation correct")
 
+    # Test 3b: Byte -> class lookup table agrees with canonicalization
+    for b in range(256):
+        canonical = canonical_representative(b)
+        assert BYTE_TO_CLASS[b] == R96_CANONICAL_BYTES.index(canonical), f"LUT mismatch for byte {b}"
+    assert canonicalize_bytes(range(256)) == BYTE_TO_CLASS
+    boundary = bytes(range(256)) * 48  # 12,288 boundary sites
+    assert canonicalize_bytes(memoryview(boundary)) == BYTE_TO_CLASS * 48
+    try:
+        canonicalize_bytes(5)
+        assert False, "canonicalize_bytes should reject a bare int"
+    except TypeError:
+        pass
+    try:
+        canonicalize_bytes(array('i', [1, 2, 3]))
+        assert False, "canonicalize_bytes should reject a buffer of wider items"
+    except TypeError:
+        pass
+    print(f"  ✓ Byte → class lookup table consistent (256 bytes)")
+
     # Test 4: Atlas field operations (EXACT)
     psi = AtlasField()
     assert psi.norm_squared() == Fraction(0), "Zero field should have zero norm (exact)"
 
-    psi[0] = ComplexFraction(1, 0)  # 1 + 0j
-    psi[1] = ComplexFraction(0, 1)  # 0 + 1j
+    psi[0] = ComplexFraction.from_ints(1, 0)  # 1 + 0j
+    psi[1] = ComplexFraction.from_ints(0, 1)  # 0 + 1j
     norm_sq = psi.norm_squared()
     assert norm_sq == Fraction(2), f"Norm squared should be exactly 2, got {norm_sq}"
 
     phi = AtlasField()
-    phi[0] = ComplexFraction(1, 0)
+    phi[0] = ComplexFraction.from_ints(1, 0)
     inner = psi.dot(phi)
-    assert inner == ComplexFraction(1, 0), f"Inner product should be exactly 1, got {inner}"
+    assert inner == ComplexFraction.from_ints(1, 0), f"Inner product should be exactly 1, got {inner}"
+    # Round-trip: the amplitudes snapshot rebuilds an equal field
+    rebuilt = AtlasField(psi.amplitudes)
+    assert rebuilt.amplitudes == psi.amplitudes, "AtlasField(psi.amplitudes) should round-trip"
     print(f"  ✓ Atlas field operations correct (EXACT, no tolerances)")
 
     # Test 5: Klein quartet field (unity class)
     klein_field = AtlasField()
-    klein_field[klein_idx] = ComplexFraction(1, 0)  # Set unity class to 1
+    klein_field[klein_idx] = ComplexFraction.from_ints(1, 0)  # Set unity class to 1
 
     # Verify all Klein bytes access the same class (EXACT equality)
     for byte_val in KLEIN_QUARTET:
         val = klein_field.get_by_byte(byte_val)
-        assert val == ComplexFraction(1, 0), f"Klein byte {byte_val} should access unity class (exact)"
+        assert val == ComplexFraction.from_ints(1, 0), f"Klein byte {byte_val} should access unity class (exact)"
     print(f"  ✓ Klein quartet field access (all access class 0, EXACT)")
 
     print("✓ All Atlas structure tests passed (EXACT ARITHMETIC)")
@@ -6,9 +6,31 @@ All arithmetic must be exact - no floating point approximations.
 Complex numbers with rational real and imaginary parts.
 """
 
+import os
+import warnings
 from fractions import Fraction
 from typing import Union
 
+# Rational backend. Python's Fraction is the default; setting
+# ATLAS_RATIONAL_BACKEND=gmpy2 switches to GMP-backed gmpy2.mpq, which
+# keeps exact semantics but does GCD/normalization in C. Falls back to
+# Fraction (with a warning) when gmpy2 is not installed.
+if os.environ.get('ATLAS_RATIONAL_BACKEND', '').lower() == 'gmpy2':
+    try:
+        from gmpy2 import mpq as Rational
+    except ImportError:
+        warnings.warn(
+            "ATLAS_RATIONAL_BACKEND=gmpy2 but gmpy2 is not installed; "
+            "falling back to fractions.Fraction",
+            RuntimeWarning
+        )
+        Rational = Fraction
+else:
+    Rational = Fraction
+
+# Types accepted as exact real scalars
+_RATIONAL_TYPES = (int, Fraction, Rational)
+
 
 class ComplexFraction:
     """
@@ -17,6 +39,8 @@ class ComplexFraction:
     This is the correct type for Atlas field amplitudes.
     """
 
+    __slots__ = ('real', 'imag')
+
     def __init__(self, real: Union[int, Fraction, str] = 0,
                  imag: Union[int, Fraction, str] = 0):
         """
@@ -26,35 +50,59 @@ class ComplexFraction:
             real: Real part (int, Fraction, or string like "1/2")
             imag: Imaginary part (int, Fraction, or string like "1/2")
         """
-        self.real = Fraction(real) if not isinstance(real, Fraction) else real
-        self.imag = Fraction(imag) if not isinstance(imag, Fraction) else imag
+        self.real = Rational(real) if not isinstance(real, Rational) else real
+        self.imag = Rational(imag) if not isinstance(imag, Rational) else imag
+
+    @classmethod
+    def _make(cls, real: Rational, imag: Rational) -> 'ComplexFraction':
+        """
+        Build from two rationals without type dispatch.
+
+        Internal fast path for arithmetic results; callers must pass
+        instances of the active Rational backend.
+        """
+        obj = object.__new__(cls)
+        obj.real = real
+        obj.imag = imag
+        return obj
+
+    @classmethod
+    def from_ints(cls, real: int, imag: int = 0) -> 'ComplexFraction':
+        """
+        Build from two integers, skipping the constructor's type dispatch.
+
+        Args:
+            real: Integer real part
+            imag: Integer imaginary part
+        """
+        return cls._make(Rational(real), Rational(imag))
 
     def __add__(self, other: 'ComplexFraction') -> 'ComplexFraction':
         """Exact addition."""
-        return ComplexFraction(
+        return ComplexFraction._make(
             self.real + other.real,
             self.imag + other.imag
         )
 
     def __sub__(self, other: 'ComplexFraction') -> 'ComplexFraction':
         """Exact subtraction."""
-        return ComplexFraction(
+        return ComplexFraction._make(
             self.real - other.real,
             self.imag - other.imag
         )
 
     def __mul__(self, other: Union['ComplexFraction', int, Fraction]) -> 'ComplexFraction':
         """Exact multiplication."""
-        if isinstance(other, (int, Fraction)):
+        if isinstance(other, _RATIONAL_TYPES):
             # Scalar multiplication
-            other_frac = Fraction(other) if not isinstance(other, Fraction) else other
-            return ComplexFraction(
+            other_frac = Rational(other) if not isinstance(other, Rational) else other
+            return ComplexFraction._make(
                 self.real * other_frac,
                 self.imag * other_frac
             )
         elif isinstance(other, ComplexFraction):
             # (a + bi)(c + di) = (ac - bd) + (ad + bc)i
-            return ComplexFraction(
+            return ComplexFraction._make(
                 self.real * other.real - self.imag * other.imag,
                 self.real * other.imag + self.imag * other.real
             )
@@ -67,45 +115,53 @@ class ComplexFraction:
 
     def __truediv__(self, other: Union['ComplexFraction', int, Fraction]) -> 'ComplexFraction':
         """Exact division."""
-        if isinstance(other, (int, Fraction)):
+        if isinstance(other, _RATIONAL_TYPES):
             # Scalar division
-            other_frac = Fraction(other) if not isinstance(other, Fraction) else other
-            return ComplexFraction(
+            other_frac = Rational(other) if not isinstance(other, Rational) else other
+            return ComplexFraction._make(
                 self.real / other_frac,
                 self.imag / other_frac
             )
         elif isinstance(other, ComplexFraction):
-            # (a + bi)/(c + di) = (a + bi)(c - di)/(c² + d²)
+            # (a + bi)/(c + di) = ((ac + bd) + (bc - ad)i)/(c² + d²)
             denom = other.real * other.real + other.imag * other.imag
-            numerator = self * other.conjugate()
-            return ComplexFraction(
-                numerator.real / denom,
-                numerator.imag / denom
+            return ComplexFraction._make(
+                (self.real * other.real + self.imag * other.imag) / denom,
+                (self.imag * other.real - self.real * other.imag) / denom
             )
         else:
             return NotImplemented
 
     def __neg__(self) -> 'ComplexFraction':
         """Negation."""
-        return ComplexFraction(-self.real, -self.imag)
+        return ComplexFraction._make(-self.real, -self.imag)
 
     def conjugate(self) -> 'ComplexFraction':
         """Complex conjugate."""
-        return ComplexFraction(self.real, -self.imag)
+        return ComplexFraction._make(self.real, -self.imag)
 
-    def norm_squared(self) -> Fraction:
+    def norm_squared(self) -> Rational:
         """Squared norm |z|² = zz̄ (exact rational)."""
         return self.real * self.real + self.imag * self.imag
 
     def __eq__(self, other: 'ComplexFraction') -> bool:
         """Exact equality (no tolerance!)."""
+        if self is other:
+            return True
         if isinstance(other, ComplexFraction):
             return self.real == other.real and self.imag == other.imag
-        elif isinstance(other, (int, Fraction)):
-            return self.real == other and self.imag == 0
+        elif isinstance(other, _RATIONAL_TYPES):
+            # A nonzero imaginary part rejects without comparing rationals
+            return not self.imag and self.real == other
         else:
             return False
 
+    def __hash__(self) -> int:
+        """Hash consistent with __eq__, including equality to real scalars."""
+        if not self.imag:
+            return hash(self.real)
+        return hash((self.real, self.imag))
+
     def __repr__(self) -> str:
         """String representation."""
         if self.imag == 0:
@@ -131,7 +187,7 @@ class ComplexFraction:
 
     def is_zero(self) -> bool:
         """Check if exactly zero."""
-        return self.real == 0 and self.imag == 0
+        return not self.real and not self.imag
 
 
 # Convenience functions for common values
@@ -141,7 +197,7 @@ def cfrac(real: Union[int, Fraction, str] = 0,
     return ComplexFraction(real, imag)
 
 
-def sqrt_exact(n: int) -> Union[Fraction, str]:
+def sqrt_exact(n: int) -> Union[Rational, str]:
     """
     Return exact square root if rational, otherwise return symbolic.
 
@@ -157,7 +213,7 @@ def sqrt_exact(n: int) -> Union[Fraction, str]:
     # Check if perfect square
     sqrt_n = int(n ** 0.5)
     if sqrt_n * sqrt_n == n:
-        return Fraction(sqrt_n)
+        return Rational(sqrt_n)
     else:
         # Return symbolic - caller must handle algebraically
         return f"sqrt({n})"
@@ -13,8 +13,8 @@ EXACT ARITHMETIC - No floats, no approximations.
 from typing import List, Tuple, Union
 from fractions import Fraction
 
-from action_framework.core.atlas_structure import R96_CANONICAL_BYTES, ByteStructure
-from action_framework.core.exact_arithmetic import ComplexFraction
+from action_framework.core.atlas_structure import R96_CANONICAL_BYTES, BYTE_TO_CLASS
+from action_framework.core.exact_arithmetic import ComplexFraction, Rational
 
 
 class F4QuotientField:
@@ -59,12 +59,7 @@ class F4QuotientField:
 
             # Apply bit-7 flip (μ involution)
             byte_j = byte_i ^ 128
-            canonical_j = ByteStructure(byte_j).canonical_representative()
-
-            try:
-                j = R96_CANONICAL_BYTES.index(canonical_j)
-            except ValueError:
-                continue
+            j = BYTE_TO_CLASS[byte_j]
 
             # Add pair (smaller index first)
             pair = tuple(sorted([i, j]))
@@ -94,22 +89,22 @@ class F4QuotientField:
         new_amplitudes = [a - b for a, b in zip(self.amplitudes, other.amplitudes)]
         return F4QuotientField(new_amplitudes)
 
-    def __mul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'F4QuotientField':
+    def __mul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'F4QuotientField':
         """Exact scalar multiplication."""
         if isinstance(scalar, int):
             scalar = ComplexFraction(scalar, 0)
-        elif isinstance(scalar, Fraction):
+        elif isinstance(scalar, (Fraction, Rational)):
             scalar = ComplexFraction(scalar, 0)
         assert isinstance(scalar, ComplexFraction), f"Scalar must be ComplexFraction, got {type(scalar)}"
         new_amplitudes = [a * scalar for a in self.amplitudes]
         return F4QuotientField(new_amplitudes)
 
-    def __rmul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'F4QuotientField':
+    def __rmul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'F4QuotientField':
         return self.__mul__(scalar)
 
-    def norm_squared(self) -> Fraction:
+    def norm_squared(self) -> Rational:
         """Exact L² norm squared."""
-        return sum((a.norm_squared() for a in self.amplitudes), Fraction(0))
+        return sum((a.norm_squared() for a in self.amplitudes), Rational(0))
 
     def dot(self, other: 'F4QuotientField') -> ComplexFraction:
         """Exact inner product."""
@@ -185,22 +180,22 @@ class E6QuotientField:
         new_amplitudes = [a - b for a, b in zip(self.amplitudes, other.amplitudes)]
         return E6QuotientField(new_amplitudes)
 
-    def __mul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'E6QuotientField':
+    def __mul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'E6QuotientField':
         """Exact scalar multiplication."""
         if isinstance(scalar, int):
             scalar = ComplexFraction(scalar, 0)
-        elif isinstance(scalar, Fraction):
+        elif isinstance(scalar, (Fraction, Rational)):
             scalar = ComplexFraction(scalar, 0)
         assert isinstance(scalar, ComplexFraction), f"Scalar must be ComplexFraction, got {type(scalar)}"
         new_amplitudes = [a * scalar for a in self.amplitudes]
         return E6QuotientField(new_amplitudes)
 
-    def __rmul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'E6QuotientField':
+    def __rmul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'E6QuotientField':
         return self.__mul__(scalar)
 
-    def norm_squared(self) -> Fraction:
+    def norm_squared(self) -> Rational:
         """Exact L² norm squared."""
-        return sum((a.norm_squared() for a in self.amplitudes), Fraction(0))
+        return sum((a.norm_squared() for a in self.amplitudes), Rational(0))
 
     def dot(self, other: 'E6QuotientField') -> ComplexFraction:
         """Exact inner product."""
@@ -256,22 +251,22 @@ class E7QuotientField:
         new_amplitudes = [a - b for a, b in zip(self.amplitudes, other.amplitudes)]
         return E7QuotientField(new_amplitudes)
 
-    def __mul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'E7QuotientField':
+    def __mul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'E7QuotientField':
         """Exact scalar multiplication."""
         if isinstance(scalar, int):
             scalar = ComplexFraction(scalar, 0)
-        elif isinstance(scalar, Fraction):
+        elif isinstance(scalar, (Fraction, Rational)):
             scalar = ComplexFraction(scalar, 0)
         assert isinstance(scalar, ComplexFraction), f"Scalar must be ComplexFraction, got {type(scalar)}"
         new_amplitudes = [a * scalar for a in self.amplitudes]
         return E7QuotientField(new_amplitudes)
 
-    def __rmul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'E7QuotientField':
+    def __rmul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'E7QuotientField':
         return self.__mul__(scalar)
 
-    def norm_squared(self) -> Fraction:
+    def norm_squared(self) -> Rational:
         """Exact L² norm squared."""
-        return sum((a.norm_squared() for a in self.amplitudes), Fraction(0))
+        return sum((a.norm_squared() for a in self.amplitudes), Rational(0))
 
     def dot(self, other: 'E7QuotientField') -> ComplexFraction:
         """Exact inner product."""
@@ -327,22 +322,22 @@ class E8QuotientField:
         new_amplitudes = [a - b for a, b in zip(self.amplitudes, other.amplitudes)]
         return E8QuotientField(new_amplitudes)
 
-    def __mul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'E8QuotientField':
+    def __mul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'E8QuotientField':
         """Exact scalar multiplication."""
         if isinstance(scalar, int):
             scalar = ComplexFraction(scalar, 0)
-        elif isinstance(scalar, Fraction):
+        elif isinstance(scalar, (Fraction, Rational)):
             scalar = ComplexFraction(scalar, 0)
         assert isinstance(scalar, ComplexFraction), f"Scalar must be ComplexFraction, got {type(scalar)}"
         new_amplitudes = [a * scalar for a in self.amplitudes]
         return E8QuotientField(new_amplitudes)
 
-    def __rmul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'E8QuotientField':
+    def __rmul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'E8QuotientField':
         return self.__mul__(scalar)
 
-    def norm_squared(self) -> Fraction:
+    def norm_squared(self) -> Rational:
         """Exact L² norm squared."""
-        return sum((a.norm_squared() for a in self.amplitudes), Fraction(0))
+        return sum((a.norm_squared() for a in self.amplitudes), Rational(0))
 
     def dot(self, other: 'E8QuotientField') -> ComplexFraction:
         """Exact inner product."""
@@ -395,22 +390,22 @@ class G2QuotientField:
         new_amplitudes = [a - b for a, b in zip(self.amplitudes, other.amplitudes)]
         return G2QuotientField(new_amplitudes)
 
-    def __mul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'G2QuotientField':
+    def __mul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'G2QuotientField':
         """Exact scalar multiplication."""
         if isinstance(scalar, int):
             scalar = ComplexFraction(scalar, 0)
-        elif isinstance(scalar, Fraction):
+        elif isinstance(scalar, (Fraction, Rational)):
             scalar = ComplexFraction(scalar, 0)
         assert isinstance(scalar, ComplexFraction), f"Scalar must be ComplexFraction, got {type(scalar)}"
         new_amplitudes = [a * scalar for a in self.amplitudes]
         return G2QuotientField(new_amplitudes)
 
-    def __rmul__(self, scalar: Union[int, Fraction, ComplexFraction]) -> 'G2QuotientField':
+    def __rmul__(self, scalar: Union[int, Fraction, Rational, ComplexFraction]) -> 'G2QuotientField':
         return self.__mul__(scalar)
 
-    def norm_squared(self) -> Fraction:
+    def norm_squared(self) -> Rational:
         """Exact L² norm squared."""
-        return sum((a.norm_squared() for a in self.amplitudes), Fraction(0))
+        return sum((a.norm_squared() for a in self.amplitudes), Rational(0))
 
     def dot(self, other: 'G2QuotientField') -> ComplexFraction:
         """Exact inner product."""
@@ -454,9 +449,9 @@ if __name__ == '__main__':
 
     # Set some values (EXACT)
     for i in range(24):
-        f4[i] = ComplexFraction(1, 0)  # Short roots with norm² = 1
+        f4[i] = ComplexFraction.from_ints(1, 0)  # Short roots with norm² = 1
     for i in range(24, 48):
-        f4[i] = ComplexFraction(1, 1)  # Long roots: |1+i|² = 2 exactly
+        f4[i] = ComplexFraction.from_ints(1, 1)  # Long roots: |1+i|² = 2 exactly
 
     short, long = f4.classify_by_norm()
     print(f"  Classification: {len(short)} short, {len(long)} long")
@@ -468,7 +463,7 @@ if __name__ == '__main__':
     print(f"\nE₆ quotient: {len(e6.amplitudes)} roots")
 
     for i in range(72):
-        e6[i] = ComplexFraction(1, 0)  # All roots same length (simply-laced)
+        e6[i] = ComplexFraction.from_ints(1, 0)  # All roots same length (simply-laced)
 
     norm_sq_e6 = e6.norm_squared()
     print(f"  Total norm² (exact): {norm_sq_e6}")
@@ -479,7 +474,7 @@ if __name__ == '__main__':
     print(f"\nE₇ quotient: {len(e7.amplitudes)} roots")
 
     for i in range(126):
-        e7[i] = ComplexFraction(1, 0)  # All roots same length (simply-laced)
+        e7[i] = ComplexFraction.from_ints(1, 0)  # All roots same length (simply-laced)
 
     norm_sq_e7 = e7.norm_squared()
     print(f"  Total norm² (exact): {norm_sq_e7}")
@@ -493,7 +488,7 @@ if __name__ == '__main__':
     # Use |√2| exactly: ComplexFraction(√2, 0) → need to represent √2
     # For exact arithmetic with norm² = 2: use ComplexFraction(1, 1) → |1+i|² = 2
     for i in range(240):
-        e8[i] = ComplexFraction(1, 1)  # |1+i|² = 2 exactly
+        e8[i] = ComplexFraction.from_ints(1, 1)  # |1+i|² = 2 exactly
 
     norm_sq_e8 = e8.norm_squared()
     print(f"  Total norm² (exact): {norm_sq_e8}")
@@ -504,7 +499,7 @@ if __name__ == '__main__':
     print(f"\nG₂ quotient: {len(g2.amplitudes)} roots")
 
     for i in range(6):
-        g2[i] = ComplexFraction(1, 0)  # Short roots with norm² = 1
+        g2[i] = ComplexFraction.from_ints(1, 0)  # Short roots with norm² = 1
     for i in range(6, 12):
         # Long roots for G₂: use complex number with norm² = 3
         # |a+bi|² = a² + b² = 3, one solution: a=1, b=√2
@@ -35,7 +35,7 @@ def load_e6_canonical() -> E6QuotientField:
 
     # All 72 roots have norm² = 1 exactly (simply-laced)
     for i in range(72):
-        psi[i] = ComplexFraction(1, 0)  # 1 + 0j, |·|² = 1
+        psi[i] = ComplexFraction.from_ints(1, 0)  # 1 + 0j, |·|² = 1
 
     return psi
 
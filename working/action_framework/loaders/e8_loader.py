@@ -38,7 +38,7 @@ def load_e8_canonical() -> E8QuotientField:
 
     # All 240 roots have norm² = 2 exactly (simply-laced, standard normalization)
     for i in range(240):
-        psi[i] = ComplexFraction(1, 1)  # 1 + i, |·|² = 2
+        psi[i] = ComplexFraction.from_ints(1, 1)  # 1 + i, |·|² = 2
 
     return psi
 
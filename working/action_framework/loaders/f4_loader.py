@@ -40,11 +40,11 @@ def load_f4_canonical() -> F4QuotientField:
 
     # 24 short roots: norm² = 1 exactly
     for i in range(24):
-        psi[i] = ComplexFraction(1, 0)  # 1 + 0j, |·|² = 1
+        psi[i] = ComplexFraction.from_ints(1, 0)  # 1 + 0j, |·|² = 1
 
     # 24 long roots: norm² = 2 exactly
     for i in range(24, 48):
-        psi[i] = ComplexFraction(1, 1)  # 1 + 1j, |·|² = 1² + 1² = 2
+        psi[i] = ComplexFraction.from_ints(1, 1)  # 1 + 1j, |·|² = 1² + 1² = 2
 
     return psi
 
@@ -19,7 +19,7 @@ from typing import List, Set, Tuple
 
 from action_framework.core.atlas_structure import (
     AtlasField, R96_CANONICAL_BYTES, get_klein_class_index,
-    ByteStructure
+    BYTE_TO_CLASS
 )
 
 
@@ -106,15 +106,8 @@ class MirrorSector:
             # Apply bit-7 flip
             byte_j = byte_i ^ 128
 
-            # Find its canonical representative
-            canonical_j = ByteStructure(byte_j).canonical_representative()
-
-            # Find index in R96
-            try:
-                j = R96_CANONICAL_BYTES.index(canonical_j)
-            except ValueError:
-                # If not in R96, skip (shouldn't happen for canonical bytes)
-                continue
+            # Find its resonance class
+            j = BYTE_TO_CLASS[byte_j]
 
             # Only add each pair once
             if i < j:
@@ -230,14 +223,8 @@ class GraphSmoothnessSector:
             for bit_pos in range(8):
                 byte_j = byte_i ^ (1 << bit_pos)
 
-                # Canonicalize
-                canonical_j = ByteStructure(byte_j).canonical_representative()
-
-                # Find in R96
-                try:
-                    j = R96_CANONICAL_BYTES.index(canonical_j)
-                except ValueError:
-                    continue  # Not adjacent within R96
+                # Canonicalize to its resonance class
+                j = BYTE_TO_CLASS[byte_j]
 
                 # Add edge (once)
                 if i < j:
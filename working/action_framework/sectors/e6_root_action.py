@@ -202,7 +202,7 @@ if __name__ == '__main__':
     # Test with correct E₆ configuration (all roots norm²=1)
     psi = E6QuotientField()
     for i in range(72):
-        psi[i] = ComplexFraction(1, 0)  # All roots norm²=1 exactly
+        psi[i] = ComplexFraction.from_ints(1, 0)  # All roots norm²=1 exactly
 
     E = action.energy(psi)
     stats = action.compute_root_statistics(psi)
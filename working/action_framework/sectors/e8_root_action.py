@@ -204,7 +204,7 @@ if __name__ == '__main__':
     # Test with correct E₈ configuration (all roots norm²=2)
     psi = E8QuotientField()
     for i in range(240):
-        psi[i] = ComplexFraction(1, 1)  # |1+i|² = 2 exactly
+        psi[i] = ComplexFraction.from_ints(1, 1)  # |1+i|² = 2 exactly
 
     E = action.energy(psi)
     stats = action.compute_root_statistics(psi)
@@ -221,7 +221,7 @@ if __name__ == '__main__':
     # Test with correct F₄ configuration (EXACT)
     psi = F4QuotientField()
     for i in range(24):
-        psi[i] = ComplexFraction(1, 0)  # 24 short roots, norm²=1 exactly
+        psi[i] = ComplexFraction.from_ints(1, 0)  # 24 short roots, norm²=1 exactly
     for i in range(24, 48):
         # Long roots: norm² should be exactly 2
         # For testing, we need sqrt(2) which is irrational
@@ -232,7 +232,7 @@ if __name__ == '__main__':
         # Since sqrt(2) is irrational, we'll handle this properly in the loader
         # For now, test with exact value that gives exactly norm² = 2
         # Use two components: ComplexFraction(1, 1) gives |1+i|² = 1+1 = 2
-        psi[i] = ComplexFraction(1, 1)  # |1+i|² = 2 exactly!
+        psi[i] = ComplexFraction.from_ints(1, 1)  # |1+i|² = 2 exactly!
 
     E = action.energy(psi)
     stats = action.compute_root_statistics(psi)
@@ -0,0 +1,190 @@
+"""
+Tests for the exact complex arithmetic module.
+"""
+import contextlib
+import importlib
+import os
+import sys
+import unittest
+from fractions import Fraction
+from unittest import mock
+
+from action_framework import core
+from action_framework.core import atlas_structure, exact_arithmetic, quotient_field
+from action_framework.core.exact_arithmetic import ComplexFraction, Rational
+
+try:
+    from gmpy2 import mpq
+except ImportError:
+    mpq = None
+
+
+# Small sample of rationals covering sign, zero and non-trivial denominators
+SAMPLE = [Fraction(0), Fraction(1), Fraction(-3, 4), Fraction(5, 6), Fraction(-7, 2)]
+
+
+class TestComplexFraction(unittest.TestCase):
+    """Exact semantics of ComplexFraction under the active Rational backend."""
+
+    def test_parts_use_backend(self):
+        """Constructor converts int, Fraction and str inputs to the backend type."""
+        for z in (ComplexFraction(1, 2), ComplexFraction(Fraction(1, 2), 0), ComplexFraction("1/3", "-2")):
+            self.assertIsInstance(z.real, Rational)
+            self.assertIsInstance(z.imag, Rational)
+
+    def test_from_ints(self):
+        """from_ints builds the same value as the general constructor."""
+        for r in (-2, 0, 3):
+            for i in (-1, 0, 5):
+                z = ComplexFraction.from_ints(r, i)
+                self.assertEqual(z, ComplexFraction(r, i))
+                self.assertIsInstance(z.real, Rational)
+                self.assertIsInstance(z.imag, Rational)
+
+    def test_matches_fraction_reference(self):
+        """add, sub, mul, truediv and neg agree exactly with Fraction arithmetic."""
+        for a in SAMPLE:
+            for b in SAMPLE:
+                for c in SAMPLE:
+                    for d in SAMPLE:
+                        z = ComplexFraction(a, b)
+                        w = ComplexFraction(c, d)
+                        self.assertEqual(z + w, ComplexFraction(a + c, b + d))
+                        self.assertEqual(z - w, ComplexFraction(a - c, b - d))
+                        self.assertEqual(z * w, ComplexFraction(a * c - b * d, a * d + b * c))
+                        self.assertEqual(-z, ComplexFraction(-a, -b))
+                        denom = c * c + d * d
+                        if denom != 0:
+                            expected = ComplexFraction((a * c + b * d) / denom, (b * c - a * d) / denom)
+                            self.assertEqual(z / w, expected)
+
+    def test_equality_is_exact(self):
+        """Equal rationals in different forms compare equal; no tolerance."""
+        self.assertEqual(ComplexFraction(Fraction(1, 2), 0), ComplexFraction(Fraction(2, 4), 0))
+        self.assertEqual(ComplexFraction(3, 0), 3)
+        self.assertEqual(ComplexFraction(Fraction(1, 2), 0), Fraction(1, 2))
+        self.assertNotEqual(ComplexFraction(1, 1), 1)
+        self.assertNotEqual(ComplexFraction(Fraction(1, 3), 0), ComplexFraction(Fraction(333, 1000), 0))
+
+    def test_hash_consistent_with_equality(self):
+        """Equal values hash equal, including against real scalars."""
+        self.assertEqual(hash(ComplexFraction(Fraction(1, 2), 0)), hash(ComplexFraction(Fraction(2, 4), 0)))
+        self.assertEqual(hash(ComplexFraction(3, 0)), hash(3))
+        self.assertEqual(hash(ComplexFraction(1, 2)), hash(ComplexFraction("1", "2")))
+        self.assertEqual(len({ComplexFraction(1, 1), ComplexFraction(1, 1), ComplexFraction(1, -1)}), 2)
+
+    def test_division_by_zero(self):
+        """Division by exact zero raises."""
+        with self.assertRaises(ZeroDivisionError):
+            ComplexFraction(1, 1) / ComplexFraction(0, 0)
+
+
+@unittest.skipIf(mpq is None, "gmpy2 not installed")
+class TestGmpy2Semantics(unittest.TestCase):
+    """gmpy2.mpq must agree with Fraction on every operation ComplexFraction uses."""
+
+    def test_operations_match(self):
+        for a in SAMPLE:
+            for b in SAMPLE:
+                ma, mb = mpq(a.numerator, a.denominator), mpq(b.numerator, b.denominator)
+                self.assertEqual(ma + mb, a + b)
+                self.assertEqual(ma - mb, a - b)
+                self.assertEqual(ma * mb, a * b)
+                self.assertEqual(-ma, -a)
+                self.assertEqual(ma == mb, a == b)
+                if b != 0:
+                    self.assertEqual(ma / mb, a / b)
+
+    def test_str_matches(self):
+        """String form is used by ComplexFraction.__repr__."""
+        for a in SAMPLE:
+            self.assertEqual(str(mpq(a.numerator, a.denominator)), str(a))
+
+
+@contextlib.contextmanager
+def _fresh_backend(environ):
+    """
+    Import fresh copies of the arithmetic modules under a patched environment.
+
+    The backend is chosen at import time. Fresh copies are used instead of
+    reloading in place so classes already imported by other modules and
+    tests stay valid; sys.modules and the package attributes are restored
+    on exit.
+    """
+    with mock.patch.dict(os.environ, environ), \
+            mock.patch.dict(sys.modules), \
+            mock.patch.object(core, 'exact_arithmetic', exact_arithmetic), \
+            mock.patch.object(core, 'atlas_structure', atlas_structure), \
+            mock.patch.object(core, 'quotient_field', quotient_field):
+        for module in (exact_arithmetic, atlas_structure, quotient_field):
+            del sys.modules[module.__name__]
+        yield (importlib.import_module(exact_arithmetic.__name__),
+               importlib.import_module(atlas_structure.__name__),
+               importlib.import_module(quotient_field.__name__))
+
+
+class TestBackendSelection(unittest.TestCase):
+    """ATLAS_RATIONAL_BACKEND is read at import time."""
+
+    def test_missing_gmpy2_warns_and_falls_back(self):
+        """Requesting gmpy2 without it installed warns and uses Fraction."""
+        with mock.patch.dict(sys.modules, {'gmpy2': None}):
+            with self.assertWarns(RuntimeWarning):
+                with _fresh_backend({'ATLAS_RATIONAL_BACKEND': 'gmpy2'}) as (ea, _, _):
+                    self.assertIs(ea.Rational, Fraction)
+        self.assertIs(exact_arithmetic.ComplexFraction, ComplexFraction)
+
+    @unittest.skipIf(mpq is None, "gmpy2 not installed")
+    def test_gmpy2_backend(self):
+        """ComplexFraction, AtlasField and quotient fields run exactly on gmpy2.mpq."""
+        with _fresh_backend({'ATLAS_RATIONAL_BACKEND': 'gmpy2'}) as (ea, atlas, qf):
+            self._check_gmpy2_backend(ea, atlas, qf)
+        self.assertIs(exact_arithmetic.ComplexFraction, ComplexFraction)
+
+    def _check_gmpy2_backend(self, ea, atlas, qf):
+        CF = ea.ComplexFraction
+        self.assertIs(ea.Rational, mpq)
+
+        z = CF(1, 2)
+        self.assertIsInstance(z.real, mpq)
+        self.assertIsInstance(z.imag, mpq)
+        self.assertIsInstance(CF.from_ints(3, 4).real, mpq)
+
+        for a in SAMPLE:
+            for b in SAMPLE:
+                z = CF(a, b)
+                w = CF(b, a)
+                self.assertEqual(z + w, CF(a + b, a + b))
+                self.assertEqual(z - w, CF(a - b, b - a))
+                self.assertEqual(z * w, CF(a * b - b * a, a * a + b * b))
+                self.assertEqual(-z, CF(-a, -b))
+                if not w.is_zero():
+                    self.assertEqual((z / w) * w, z)
+                self.assertEqual(hash(z), hash(CF(a, b)))
+
+        self.assertEqual(hash(CF(3, 0)), hash(3))
+        self.assertEqual(CF(Fraction(1, 2), 0), Fraction(1, 2))
+
+        psi = atlas.AtlasField()
+        psi[0] = CF.from_ints(1, 0)
+        psi[1] = CF.from_ints(0, 1)
+        self.assertEqual(psi.norm_squared(), 2)
+        self.assertIsInstance(psi.norm_squared(), mpq)
+        self.assertEqual(psi.dot(psi), CF(2, 0))
+        self.assertEqual((psi * CF(Fraction(1, 2), 0)).norm_squared(), Fraction(1, 2))
+
+
+        # Quotient fields accept backend scalars, e.g. their own norm
+        f4 = qf.F4QuotientField()
+        for i in range(48):
+            f4[i] = CF.from_ints(1, 1)
+        norm = f4.norm_squared()
+        self.assertIsInstance(norm, mpq)
+        self.assertEqual(norm, 96)
+        scaled = f4 * norm
+        self.assertEqual(scaled[0], CF(96, 96))
+        self.assertEqual((mpq(1, 2) * f4).norm_squared(), 24)
+
+
+if __name__ == '__main__':
+    unittest.main()